@@ -85,9 +85,9 @@ async def overwatcher(
     actor = OverwatcherActor.from_config(actor_config, dry_run=dry_run)
     await actor.start()
 
-    while True:
-        await asyncio.sleep(5)
-        continue
+    # The actor runs in its own tasks. Wait until cancelled without waking up
+    # the event loop periodically.
+    await asyncio.Event().wait()
 
 
 @gort.command()
@@ -12,15 +12,17 @@ import asyncio
 from datetime import UTC, datetime, timedelta
 from functools import partial
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, Coroutine
 
 import polars
 from packaging.version import Version
 
+from sdsstools.utils import GatheringTaskGroup
+
 from gort import config
 from gort.devices.core import GortDevice, GortDeviceSet
 from gort.enums import GuiderStatus
-from gort.exceptions import ErrorCode, GortError, GortGuiderError
+from gort.exceptions import ErrorCode, GortError, GortGuiderError, GortTimeoutError
 from gort.tools import GuiderMonitor, cancel_task
 
 
@@ -560,6 +562,32 @@ class GuiderSet(GortDeviceSet[Guider]):
     __DEVICE_CLASS__ = Guider
     __DEPLOYMENTS__ = ["lvmguider"]
 
+    async def _run_all(
+        self,
+        coros: list[Coroutine[Any, Any, Any]],
+        timeout: float | None = None,
+        action: str = "running guider tasks",
+    ) -> list[Any]:
+        """Runs coroutines concurrently in a task group with a timeout.
+
+        If one of the coroutines fails or the timeout is reached the rest are
+        cancelled. The first error is re-raised so that callers see the same
+        exception as when running a single guider.
+
+        """
+
+        try:
+            async with asyncio.timeout(timeout):
+                async with GatheringTaskGroup() as group:
+                    for coro in coros:
+                        group.create_task(coro)
+        except TimeoutError:
+            raise GortTimeoutError(f"Timed out after {timeout} s while {action}.")
+        except ExceptionGroup as err:
+            raise err.exceptions[0] from err
+
+        return group.results()
+
     async def expose(self, *args, continuous: bool = False, **kwargs):
         """Exposes all the cameras using the guider.
 
@@ -602,7 +630,9 @@ class GuiderSet(GortDeviceSet[Guider]):
             )
 
         if len(cmds) > 0:
-            await asyncio.gather(*cmds)
+            timeouts = self.gort.config["guiders"].get("timeouts", {})
+            timeout = timeouts.get("take_darks", 120)
+            await self._run_all(cmds, timeout=timeout, action="taking darks")
 
     async def focus(
         self,
@@ -654,7 +684,10 @@ class GuiderSet(GortDeviceSet[Guider]):
             )
             for guider_name in self
         ]
-        results = await asyncio.gather(*jobs)
+
+        timeouts = self.gort.config["guiders"].get("timeouts", {})
+        timeout = timeouts.get("focus", 600)
+        results = await self._run_all(jobs, timeout=timeout, action="focusing")
 
         best_focus: list[str] = []
         error: bool = False
@@ -332,24 +332,33 @@ class Exposure(asyncio.Future["Exposure"]):
         self._progress.start()
 
         async def update_timer():
+            loop = asyncio.get_running_loop()
+            t0 = loop.time()
+
             elapsed = 0
+            advance = 1
             while True:
                 if self._progress is None:
                     return
                 elif elapsed < exposure_time:
-                    self._progress.update(exp_task, advance=1)
+                    self._progress.update(exp_task, advance=advance)
                 else:
                     self._progress.update(
                         exp_task,
                         description="[green] Integration complete",
                         completed=int(exposure_time),
                     )
-                    self._progress.update(readout_task, advance=1, visible=True)
+                    self._progress.update(readout_task, advance=advance, visible=True)
 
                 asyncio.create_task(run_in_executor(self._progress.refresh))
 
-                await asyncio.sleep(1)
-                elapsed += 1
+                # Wait until the next whole second since the timer started so that
+                # the counter does not drift. If the loop was blocked for longer,
+                # advance by the number of seconds that have passed.
+                await asyncio.sleep(max(0.0, t0 + elapsed + 1 - loop.time()))
+                new_elapsed = max(elapsed + 1, int(loop.time() - t0))
+                advance = new_elapsed - elapsed
+                elapsed = new_elapsed
 
         self._timer_task = asyncio.create_task(update_timer())
 
@@ -479,8 +488,12 @@ class Exposure(asyncio.Future["Exposure"]):
 
         column_data: list[dict[str, Any]] = []
 
-        for file in files:
-            header_ap = dict(await run_in_executor(fits.getheader, str(file)))
+        # Read the headers of all the cameras concurrently.
+        headers = await asyncio.gather(
+            *[run_in_executor(fits.getheader, str(file)) for file in files]
+        )
+
+        for header_ap in map(dict, headers):
             header_ap.pop("COMMENT", None)
 
             header = {kk.upper(): vv for kk, vv in header_ap.items() if vv is not None}
@@ -329,7 +329,7 @@ class ObserverOverwatcher(OverwatcherModule):
                     continue
 
             finally:
-                self.exposure_completes = 0
+                self.next_exposure_completes = 0
 
                 if self.is_cancelling:
                     try:
@@ -449,7 +449,7 @@ class ObserverOverwatcher(OverwatcherModule):
 
             # If we reach twilight this will cause the overwatcher
             # to immediately stop observations.
-            self.exposure_completes = 0
+            self.next_exposure_completes = 0
 
             try:
                 await asyncio.wait_for(
@@ -72,10 +72,14 @@ class OverwatcherMainTask(OverwatcherTask):
     keep_alive = True
     restart_on_error = True
 
+    # Initial and maximum delay, in seconds, before retrying after an error.
+    ERROR_BACKOFF_MIN: float = 1
+    ERROR_BACKOFF_MAX: float = 60
+
     def __init__(self, overwatcher: Overwatcher):
         super().__init__(overwatcher)
 
-        self._pending_close_dome: bool = False
+        self._error_backoff: float = self.ERROR_BACKOFF_MIN
 
     async def task(self):
         """Main overwatcher task."""
@@ -132,8 +136,16 @@ class OverwatcherMainTask(OverwatcherTask):
                     level="error",
                 )
 
-                # Avoid rapid fire errors. Sleep a bit longer before trying again.
-                await asyncio.sleep(30)
+                # Avoid rapid fire errors. Back off exponentially if the error
+                # persists but retry quickly after a transient failure.
+                await asyncio.sleep(self._error_backoff)
+                self._error_backoff = min(
+                    self._error_backoff * 2,
+                    self.ERROR_BACKOFF_MAX,
+                )
+
+            else:
+                self._error_backoff = self.ERROR_BACKOFF_MIN
 
             await asyncio.sleep(5)
 
@@ -239,17 +251,45 @@ class OverwatcherPingTask(OverwatcherTask):
     """Emits a ping notification every five minutes."""
 
     name = "overwatcher_ping"
-    keep_alive = True
-    restart_on_error = True
 
     delay: float = 900
 
-    async def task(self):
-        """Ping task."""
+    def __init__(self, overwatcher: Overwatcher):
+        super().__init__(overwatcher)
 
-        while True:
-            await asyncio.sleep(self.delay)
-            self.log.debug("I am alive!")
+        self._handle: asyncio.TimerHandle | None = None
+
+    async def run(self):
+        """Schedules the ping callback.
+
+        The ping does not need a long-lived coroutine or heartbeat monitor, so
+        we schedule a callback in the event loop that re-arms itself.
+
+        """
+
+        self._schedule()
+        self._log.debug(f"Task {self.name!r} started.")
+
+    async def cancel(self):
+        """Cancels the ping callback."""
+
+        if self._handle:
+            self._handle.cancel()
+            self._handle = None
+
+        self._log.debug(f"Task {self.name!r} was cancelled.")
+
+    def _schedule(self):
+        """Schedules the next ping."""
+
+        loop = asyncio.get_running_loop()
+        self._handle = loop.call_later(self.delay, self._ping)
+
+    def _ping(self):
+        """Emits the ping and schedules the next one."""
+
+        self.log.debug("I am alive!")
+        self._schedule()
 
 
 class Overwatcher(NotifierMixIn):
@@ -321,6 +361,8 @@ class Overwatcher(NotifierMixIn):
         if not self.gort.is_connected():
             await self.gort.init()
 
+        # Start the modules first. The main task checks the alerts and ephemeris
+        # data as soon as it starts, so it must not run until the modules are up.
         async with GatheringTaskGroup() as group:
             for module in OverwatcherModule.instances:
                 self.log.info(f"Starting overwatcher module {module.name!r}")
@@ -167,6 +167,15 @@ class TwilightFlats(BaseRecipe):
     # Maximum exposure time for extra flats.
     MAX_EXP_TIME_EXTRA: ClassVar[float] = 100
 
+    # Maximum time to sleep, in seconds, while waiting for twilight before
+    # recalculating the time to twilight flats.
+    WAIT_INTERVAL: ClassVar[float] = 10
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        self._last_fibre_str: str | None = None
+
     async def recipe(
         self,
         wait: bool = True,
@@ -181,6 +190,8 @@ class TwilightFlats(BaseRecipe):
 
         await self.gort.cleanup()
 
+        self._last_fibre_str = None
+
         if not (await self.gort.enclosure.is_open()):
             raise RuntimeError("Dome must be open to take twilight flats.")
 
@@ -216,6 +227,7 @@ class TwilightFlats(BaseRecipe):
 
         n_observed: int = 0
         all_done: bool = False
+        waiting: bool = False
 
         while True:
             # Calculate the number of minutes into the twilight. Positive values
@@ -238,11 +250,19 @@ class TwilightFlats(BaseRecipe):
 
             if time_to_flat_twilighs > 0:
                 if wait:
-                    self.gort.log.info(
-                        "Waiting for twilight. Time to twilight flats: "
-                        f"{time_to_flat_twilighs:.1f} minutes."
+                    if not waiting:
+                        self.gort.log.info(
+                            "Waiting for twilight. Time to twilight flats: "
+                            f"{time_to_flat_twilighs:.1f} minutes."
+                        )
+                        waiting = True
+
+                    # Sleep in short intervals and recompute the time to twilight
+                    # on each iteration. This prevents drift and allows the recipe
+                    # to be cancelled promptly while waiting.
+                    await asyncio.sleep(
+                        min(time_to_flat_twilighs * 60, self.WAIT_INTERVAL)
                     )
-                    await asyncio.sleep(time_to_flat_twilighs * 60)
                     continue
                 else:
                     raise RuntimeError("Too early to take twilight flats.")
@@ -317,11 +337,21 @@ class TwilightFlats(BaseRecipe):
                 n_fibre -= 12
 
     async def goto_fibre_position(self, n_fibre: int, secondary: bool = False):
-        """Moves the mask to a fibre position."""
+        """Moves the mask to a fibre position.
+
+        If the mask was already moved to that position by this recipe, the move
+        is skipped.
+
+        """
 
         fibre_str = f"P1-{n_fibre}"
         if secondary:
             fibre_str = f"P2-{n_fibre}"
+
+        if fibre_str == self._last_fibre_str:
+            return fibre_str
+
         await self.gort.telescopes.spec.fibsel.move_to_position(fibre_str)
+        self._last_fibre_str = fibre_str
 
         return fibre_str
@@ -102,9 +102,11 @@ class StartupRecipe(BaseRecipe):
         )
 
         self.gort.log.info("Turning off all calibration lamps and dome lights.")
-        await self.gort.nps.calib.all_off()
-        await self.gort.enclosure.lights.dome_all_off()
-        await self.gort.enclosure.lights.spectrograph_room.off()
+        await asyncio.gather(
+            self.gort.nps.calib.all_off(),
+            self.gort.enclosure.lights.dome_all_off(),
+            self.gort.enclosure.lights.spectrograph_room.off(),
+        )
 
         self.gort.log.info("Reconnecting AG cameras.")
         await self.gort.ags.reconnect()
@@ -278,8 +280,10 @@ class CleanupRecipe(BaseRecipe):
 
         if turn_lamps_off:
             self.gort.log.info("Turning off all calibration lamps and dome lights.")
-            await self.gort.nps.calib.all_off()
-            await self.gort.enclosure.lights.dome_all_off()
+            await asyncio.gather(
+                self.gort.nps.calib.all_off(),
+                self.gort.enclosure.lights.dome_all_off(),
+            )
 
         # Turn off lights in the dome.
         await asyncio.gather(
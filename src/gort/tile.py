@@ -8,14 +8,20 @@
 
 from __future__ import annotations
 
+import os
+import pathlib
 import warnings
+from functools import cached_property
 
 from typing import Sequence, cast
 
+import numpy
 import polars
-from astropy.coordinates import EarthLocation, SkyCoord
+from astropy import units as uu
+from astropy.coordinates import AltAz, EarthLocation, SkyCoord
 from astropy.time import Time
 from httpx import RequestError
+from peewee import DatabaseError, PostgresqlDatabase
 
 from gort import config
 from gort.exceptions import (
@@ -37,6 +43,7 @@ from gort.transforms import fibre_to_master_frame, offset_to_master_frame_pixel
 
 __all__ = [
     "Coordinates",
+    "ExcludedCoordinates",
     "QuerableCoordinates",
     "ScienceCoordinates",
     "SkyCoordinates",
@@ -48,6 +55,106 @@ __all__ = [
 CoordTuple = tuple[float, float]
 
 
+# Observatory location. Computed once since it is used for every altitude check.
+_SITE_LOCATION = EarthLocation.from_geodetic(**config["site"])
+
+
+def _get_altaz_frame(time: Time | None = None) -> AltAz:
+    """Returns the observatory AltAz frame at a given time (default: now)."""
+
+    obstime = time if time is not None else Time.now()
+
+    return AltAz(obstime=obstime, location=_SITE_LOCATION)
+
+
+def _calculate_altitudes(ra, dec, time: Time | None = None) -> numpy.ndarray:
+    """Returns the altitude of one or more FK5 coordinates, in degrees.
+
+    All the coordinates are transformed to AltAz in a single astropy call.
+
+    """
+
+    ra = numpy.asarray(ra, dtype=numpy.float64)
+    dec = numpy.asarray(dec, dtype=numpy.float64)
+
+    sc = SkyCoord(ra=ra * uu.deg, dec=dec * uu.deg, frame="fk5")
+
+    return sc.transform_to(_get_altaz_frame(time)).alt.deg
+
+
+def _get_visible_mask(
+    ra,
+    dec,
+    min_altitude: float = 30,
+    time: Time | None = None,
+) -> numpy.ndarray:
+    """Returns a mask of the FK5 coordinates above ``min_altitude`` degrees.
+
+    The maximum altitude a target can reach is ``90 - |lat - dec|`` so targets
+    that never rise above ``min_altitude`` are rejected with a comparison and
+    only the rest are transformed to AltAz. A one degree margin is added to
+    the bound to account for precession between FK5 and the apparent frame.
+
+    """
+
+    ra = numpy.asarray(ra, dtype=numpy.float64)
+    dec = numpy.asarray(dec, dtype=numpy.float64)
+
+    max_delta = 90 - min_altitude + 1
+    mask = numpy.abs(dec - _SITE_LOCATION.lat.deg) < max_delta
+
+    if mask.any():
+        altitudes = _calculate_altitudes(ra[mask], dec[mask], time=time)
+        mask[mask] = altitudes > min_altitude
+
+    return mask
+
+
+def _radec_to_xyz(ra, dec) -> numpy.ndarray:
+    """Converts RA/Dec coordinates, in degrees, to unit vectors.
+
+    Returns an array with the Cartesian ``x, y, z`` components along the
+    last axis. The cosine of the separation between two positions is the dot
+    product of their unit vectors.
+
+    """
+
+    ra_rad = numpy.radians(ra)
+    dec_rad = numpy.radians(dec)
+    cos_dec = numpy.cos(dec_rad)
+
+    return numpy.stack(
+        [cos_dec * numpy.cos(ra_rad), cos_dec * numpy.sin(ra_rad), numpy.sin(dec_rad)],
+        axis=-1,
+    )
+
+
+def _bounding_box_mask(
+    ra: numpy.ndarray,
+    dec: numpy.ndarray,
+    ra0: float,
+    dec0: float,
+    radius: float,
+) -> numpy.ndarray:
+    """Returns a mask of the coordinates inside a box around a position.
+
+    The box is large enough to contain the circle of ``radius`` degrees around
+    ``ra0, dec0``, so any coordinate within ``radius`` is guaranteed to be in
+    the mask. All values are in degrees.
+
+    """
+
+    mask = numpy.abs(dec - dec0) <= radius
+
+    if abs(dec0) + radius < 90:
+        sin_ratio = numpy.sin(numpy.radians(radius)) / numpy.cos(numpy.radians(dec0))
+        ra_half_width = numpy.degrees(numpy.arcsin(sin_ratio))
+        delta_ra = numpy.abs((ra - ra0 + 180) % 360 - 180)
+        mask &= delta_ra <= ra_half_width
+
+    return mask
+
+
 class Coordinates:
     """Basic coordinates class.
 
@@ -77,7 +184,8 @@ class Coordinates:
         self.dec = dec
         self.pa = pa % 360 if pa is not None else 0.0
 
-        self.skycoord = SkyCoord(ra=ra, dec=dec, unit="deg", frame="fk5")
+        # The SkyCoord is created lazily. Clear it in case we are reinitialising.
+        self.__dict__.pop("skycoord", None)
 
         self.centre_on_fibre = centre_on_fibre
 
@@ -93,25 +201,23 @@ class Coordinates:
     def __str__(self):
         return f"{self.ra:.6f}, {self.dec:.6f}, {self.pa:.3f}"
 
-    def calculate_altitude(self, time: Time | None = None):
-        """Returns the current altitude of the target."""
+    @cached_property
+    def skycoord(self):
+        """The coordinates as an FK5 `~astropy.coordinates.SkyCoord`."""
 
-        if time is None:
-            time = Time.now()
+        return SkyCoord(ra=self.ra, dec=self.dec, unit="deg", frame="fk5")
 
-        location = EarthLocation.from_geodetic(**config["site"])
+    def calculate_altitude(self, time: Time | None = None):
+        """Returns the current altitude of the target."""
 
-        sc = self.skycoord.copy()
-        sc.obstime = time
-        sc.location = location
-        altaz = sc.transform_to("altaz")
+        altaz = self.skycoord.transform_to(_get_altaz_frame(time))
 
         return altaz.alt.deg
 
-    def is_observable(self):
+    def is_observable(self, time: Time | None = None):
         """Determines whether a target is observable."""
 
-        return self.calculate_altitude() > 30
+        return self.calculate_altitude(time=time) > 30
 
     def set_mf_pixel(self, fibre_name: str | None = None, xz: CoordTuple | None = None):
         """Calculates and sets the master frame pixel on which to centre the target.
@@ -149,18 +255,186 @@ class Coordinates:
         return (xmf, zmf)
 
 
+class ExcludedCoordinates:
+    """An accumulator of RA/Dec positions to exclude when selecting targets.
+
+    The positions are stored as arrays, along with their unit vectors, so that
+    they can be compared with the catalogue without rebuilding them for each
+    query.
+
+    Parameters
+    ----------
+    coordinates
+        An initial list of RA/Dec coordinates, in degrees.
+
+    """
+
+    def __init__(self, coordinates: Sequence[CoordTuple] = []):
+        self.ra = numpy.empty(0, dtype=numpy.float64)
+        self.dec = numpy.empty(0, dtype=numpy.float64)
+        self.xyz = numpy.empty((0, 3), dtype=numpy.float64)
+
+        if len(coordinates) > 0:
+            radec = numpy.array(coordinates, dtype=numpy.float64).reshape(-1, 2)
+            self.extend(radec[:, 0], radec[:, 1])
+
+    def __len__(self):
+        return len(self.ra)
+
+    def append(self, ra: float, dec: float):
+        """Adds a position to the list of excluded coordinates."""
+
+        self.extend([ra], [dec])
+
+    def extend(
+        self,
+        ra: Sequence[float] | numpy.ndarray,
+        dec: Sequence[float] | numpy.ndarray,
+    ):
+        """Adds multiple positions to the list of excluded coordinates."""
+
+        ra = numpy.asarray(ra, dtype=numpy.float64)
+        dec = numpy.asarray(dec, dtype=numpy.float64)
+
+        self.ra = numpy.concatenate([self.ra, ra])
+        self.dec = numpy.concatenate([self.dec, dec])
+        self.xyz = numpy.concatenate([self.xyz, _radec_to_xyz(ra, dec)])
+
+
+ExcludeCoordsType = Sequence[CoordTuple] | ExcludedCoordinates
+
+
 class QuerableCoordinates(Coordinates):
     """A class of coordinates that can be retrieved from the database."""
 
     __db_table__: str = ""
-    targets: SkyCoord | None = None
+
+    # Cached RA/Dec arrays, in degrees, with all the targets in the table,
+    # and their unit vectors.
+    targets_ra: numpy.ndarray | None = None
+    targets_dec: numpy.ndarray | None = None
+    targets_xyz: numpy.ndarray | None = None
+
+    # Radius, in degrees, of the region around the science pointing in which
+    # to look for the closest target first.
+    SEARCH_RADIUS: float = 5
+
+    @classmethod
+    def _get_targets(cls) -> tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]:
+        """Returns the RA/Dec arrays and unit vectors of the targets in the table.
+
+        The table is only queried the first time and the result is cached.
+
+        """
+
+        if cls.targets_ra is None or cls.targets_dec is None:
+            connection = get_db_connection()
+
+            try:
+                # Check if we have a copy of the table on disk for the current
+                # version of the table. Otherwise fetch the two columns directly
+                # into an array.
+                cache_path = cls._get_cache_path(connection)
+                targets = cls._read_cache(cache_path) if cache_path else None
+
+                if targets is None:
+                    sql = f"SELECT ra,dec from {cls.__db_table__};"
+                    cursor = connection.execute_sql(sql)
+                    targets = numpy.array(cursor.fetchall(), dtype=numpy.float64)
+                    targets = targets.reshape(-1, 2)
+
+                    if cache_path is not None:
+                        cls._write_cache(cache_path, targets)
+            finally:
+                connection.close()
+
+            cls.targets_ra = numpy.ascontiguousarray(targets[:, 0], numpy.float64)
+            cls.targets_dec = numpy.ascontiguousarray(targets[:, 1], numpy.float64)
+            cls.targets_xyz = None
+
+        # Unit vectors are only used to compare separations, for which float32
+        # precision (better than 1 arcsec at one degree) is enough and halves the
+        # memory. RA/Dec are kept as float64 since they are returned as targets.
+        if cls.targets_xyz is None:
+            xyz = _radec_to_xyz(cls.targets_ra, cls.targets_dec)
+            cls.targets_xyz = xyz.astype(numpy.float32)
+
+        return cls.targets_ra, cls.targets_dec, cls.targets_xyz
+
+    @classmethod
+    def _get_cache_path(cls, connection: PostgresqlDatabase) -> pathlib.Path | None:
+        """Returns the path to the on-disk copy of the table.
+
+        The path includes the number of rows and the maximum ``pk`` in the table
+        so that adding or removing targets invalidates the cache. Returns
+        :obj:`None` if the on-disk cache is disabled (the default) or the version
+        of the table cannot be determined.
+
+        """
+
+        cache_dir = config["services"]["database"].get("cache_dir", None)
+        if cache_dir is None:
+            return None
+
+        try:
+            cursor = connection.execute_sql(
+                f"SELECT count(*), max(pk) FROM {cls.__db_table__};"
+            )
+            row = cursor.fetchone()
+        except DatabaseError as err:
+            warnings.warn(
+                f"Failed determining targets cache version: {err}", GortWarning
+            )
+            return None
+
+        if row is None or row[1] is None:
+            return None
+
+        n_rows, max_pk = row
+        cache_file = f"{cls.__db_table__}_{n_rows}-{max_pk}.arrow"
+
+        return pathlib.Path(cache_dir).expanduser() / cache_file
+
+    @staticmethod
+    def _read_cache(cache_path: pathlib.Path) -> numpy.ndarray | None:
+        """Reads the RA/Dec of the targets from disk, if the cache exists."""
+
+        if not cache_path.exists():
+            return None
+
+        try:
+            return polars.read_ipc(cache_path).select("ra", "dec").to_numpy()
+        except (OSError, polars.exceptions.PolarsError) as err:
+            warnings.warn(f"Failed reading targets cache: {err}", GortWarning)
+            return None
+
+    @staticmethod
+    def _write_cache(cache_path: pathlib.Path, targets: numpy.ndarray):
+        """Writes the RA/Dec of the targets to disk, removing stale copies."""
+
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+
+            table = cache_path.name.rsplit("_", 1)[0]
+            for stale in cache_path.parent.glob(f"{table}_*.arrow"):
+                stale.unlink(missing_ok=True)
+
+            # Write to a temporary file first so that a concurrent process never
+            # reads a partially written file.
+            tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+            data = {"ra": targets[:, 0], "dec": targets[:, 1]}
+            polars.DataFrame(data).write_ipc(tmp_path)
+            tmp_path.replace(cache_path)
+        except OSError as err:
+            warnings.warn(f"Failed writing targets cache: {err}", GortWarning)
 
     @classmethod
     def from_science_coordinates(
         cls,
         sci_coords: ScienceCoordinates,
-        exclude_coordinates: Sequence[CoordTuple] = [],
+        exclude_coordinates: ExcludeCoordsType = [],
         exclude_invisible: bool = True,
+        time: Time | None = None,
     ):
         """Retrieves a valid and observable position from the database.
 
@@ -170,71 +444,176 @@ class QuerableCoordinates(Coordinates):
             The science coordinates. The position selected will be the
             closest to these coordinates.
         exclude_coordinates
-            A list of RA/Dec coordinates to exclude. No region closer
-            than one degree to these coordinates will be selected.
+            A list of RA/Dec coordinates or an `.ExcludedCoordinates` object
+            with the positions to exclude. No region closer than one degree
+            to these coordinates will be selected.
         exclude_invisible
             Exclude targets that are too low.
+        time
+            The time at which to check visibility. Defaults to the current time.
 
         """
 
-        connection = get_db_connection()
+        return cls.get_n_nearest(
+            sci_coords,
+            1,
+            exclude_coordinates=exclude_coordinates,
+            exclude_invisible=exclude_invisible,
+            time=time,
+        )[0]
 
-        with warnings.catch_warnings():
-            warnings.simplefilter("ignore")
-            targets = polars.read_database(
-                f"SELECT ra,dec from {cls.__db_table__};",
-                connection,
-            )
+    @classmethod
+    def get_n_nearest(
+        cls,
+        sci_coords: ScienceCoordinates,
+        n: int,
+        exclude_coordinates: ExcludeCoordsType = [],
+        exclude_invisible: bool = True,
+        min_separation: float = 1,
+        time: Time | None = None,
+    ):
+        """Retrieves the ``n`` closest valid and observable positions.
 
-        # Cache query.
-        if cls.targets is None:
-            cls.targets = SkyCoord(
-                ra=targets["ra"].to_list(),
-                dec=targets["dec"].to_list(),
-                unit="deg",
-            )
+        Positions are selected in order of separation to the science pointing,
+        skipping any position closer than ``min_separation`` to one already
+        selected. This is equivalent to calling `.from_science_coordinates` ``n``
+        times while excluding the previous results, but the catalogue is only
+        filtered once.
+
+        Parameters
+        ----------
+        sci_coords
+            The science coordinates. The positions selected will be the
+            closest to these coordinates.
+        n
+            The number of positions to return.
+        exclude_coordinates
+            A list of RA/Dec coordinates or an `.ExcludedCoordinates` object
+            with the positions to exclude. No region closer than one degree
+            to these coordinates will be selected.
+        exclude_invisible
+            Exclude targets that are too low.
+        min_separation
+            The minimum separation, in degrees, between selected positions.
+        time
+            The time at which to check visibility. Defaults to the current time.
 
-        assert cls.targets is not None
-        skycoords = cls.targets.copy()
+        Returns
+        -------
+        coordinates
+            A list with up to ``n`` positions, sorted by separation to
+            the science pointing.
 
-        # Exclude regions too close to the exlcuded ones.
-        for ex_coords in exclude_coordinates:
-            ex_skycoords = SkyCoord(ra=ex_coords[0], dec=ex_coords[1], unit="deg")
-            skycoords = skycoords[skycoords.separation(ex_skycoords).deg > 1]
+        Raises
+        ------
+        ValueError
+            If ``n`` is smaller than one.
+        TileError
+            If no valid position is found.
 
-        # Exclude targets that are too low.
-        if exclude_invisible:
-            skycoords.location = EarthLocation.from_geodetic(**config["site"])
+        """
 
-            skycoords.obstime = Time.now()
-            altaz_skycoords = skycoords.transform_to("altaz")
-            skycoords = skycoords[altaz_skycoords.alt.deg > 30]
+        if n < 1:
+            raise ValueError("n must be a positive integer.")
 
-        if len(skycoords) == 0:
+        ra, dec, xyz = cls._get_targets()
+
+        # Exclude regions too close to the exlcuded ones. We calculate the
+        # separations to all the excluded coordinates with a single product.
+        if not isinstance(exclude_coordinates, ExcludedCoordinates):
+            exclude_coordinates = ExcludedCoordinates(exclude_coordinates)
+
+        if len(exclude_coordinates) > 0:
+            ex_cos = xyz @ exclude_coordinates.xyz.astype(xyz.dtype).T
+            not_excluded = (ex_cos < numpy.cos(numpy.radians(1))).all(axis=1)
+            ra = ra[not_excluded]
+            dec = dec[not_excluded]
+            xyz = xyz[not_excluded]
+
+        # Exclude targets that are too low.
+        if exclude_invisible and len(ra) > 0:
+            visible = _get_visible_mask(ra, dec, time=time)
+            ra = ra[visible]
+            dec = dec[visible]
+            xyz = xyz[visible]
+
+        if len(ra) == 0:
             raise TileError("No sky coordinates found.")
 
-        seps = skycoords.separation(sci_coords.skycoord)
-        skycoord_min = skycoords[seps.argmin()]
+        # Select the targets around the science pointing first. If we cannot find
+        # n targets within the search radius there may be closer targets outside
+        # the box, so we repeat the selection with all of them.
+        sci_ra = sci_coords.ra
+        sci_dec = sci_coords.dec
+
+        sci_xyz = _radec_to_xyz(sci_ra, sci_dec).astype(xyz.dtype)
+
+        box_mask = _bounding_box_mask(ra, dec, sci_ra, sci_dec, cls.SEARCH_RADIUS)
+        candidates = numpy.flatnonzero(box_mask)
+        selected = cls._select_n_nearest(xyz, candidates, sci_xyz, n, min_separation)
+
+        min_cos = numpy.cos(numpy.radians(cls.SEARCH_RADIUS))
+        if len(selected) < n or (xyz[selected] @ sci_xyz).min() < min_cos:
+            candidates = numpy.arange(len(ra))
+            selected = cls._select_n_nearest(
+                xyz, candidates, sci_xyz, n, min_separation
+            )
+
+        return [cls(float(ra[idx]), float(dec[idx])) for idx in selected]
 
-        return cls(skycoord_min.ra.deg, skycoord_min.dec.deg)
+    @staticmethod
+    def _select_n_nearest(
+        xyz: numpy.ndarray,
+        candidates: numpy.ndarray,
+        sci_xyz: numpy.ndarray,
+        n: int,
+        min_separation: float,
+    ) -> list[int]:
+        """Greedily selects the closest ``candidates`` with a minimum separation."""
 
-    def verify_and_replace(self, exclude_coordinates: Sequence[CoordTuple] = []):
+        if len(candidates) == 0:
+            return []
+
+        # Sort by decreasing cosine of the separation, i.e., increasing separation.
+        cos_sep = xyz[candidates] @ sci_xyz
+        max_cos = numpy.cos(numpy.radians(min_separation))
+
+        selected: list[int] = []
+        for idx in candidates[numpy.argsort(-cos_sep)]:
+            if len(selected) > 0 and (xyz[selected] @ xyz[idx] >= max_cos).any():
+                continue
+
+            selected.append(int(idx))
+            if len(selected) == n:
+                break
+
+        return selected
+
+    def verify_and_replace(
+        self,
+        exclude_coordinates: ExcludeCoordsType = [],
+        time: Time | None = None,
+    ):
         """Verifies that the coordinates are visible and if not, replaces them.
 
         Parameters
         ----------
         exclude_coordinates
-            A list of RA/Dec coordinates to exclude. No region closer
-            than one degree to these coordinates will be selected.
+            A list of RA/Dec coordinates or an `.ExcludedCoordinates` object
+            with the positions to exclude. No region closer than one degree
+            to these coordinates will be selected.
+        time
+            The time at which to check visibility. Defaults to the current time.
 
         """
 
-        if not self.is_observable():
+        if not self.is_observable(time=time):
             # Use current coordinates as proxy for the science telescope.
             sci_coords = ScienceCoordinates(self.ra, self.dec)
             valid_skycoords = self.from_science_coordinates(
                 sci_coords,
                 exclude_coordinates=exclude_coordinates,
+                time=time,
             )
             super().__init__(valid_skycoords.ra, valid_skycoords.dec)
 
@@ -368,8 +747,11 @@ class Tile(dict[str, Coordinates | Sequence[Coordinates] | None]):
         else:
             self.set_dither_position(dither_positions[0])
 
-        self.set_sky_coords(sky_coords, allow_replacement=allow_replacement)
-        self.set_spec_coords(spec_coords, reject_invisible=allow_replacement)
+        # Use the same time for all the visibility checks.
+        now = Time.now()
+
+        self.set_sky_coords(sky_coords, allow_replacement=allow_replacement, time=now)
+        self.set_spec_coords(spec_coords, reject_invisible=allow_replacement, time=now)
 
     def __repr__(self):
         return (
@@ -636,6 +1018,7 @@ class Tile(dict[str, Coordinates | Sequence[Coordinates] | None]):
         self,
         sky_coords: SkyCoordsType = None,
         allow_replacement: bool = True,
+        time: Time | None = None,
     ) -> dict[str, SkyCoordinates]:
         """Sets the sky telescopes coordinates.
 
@@ -647,6 +1030,8 @@ class Tile(dict[str, Coordinates | Sequence[Coordinates] | None]):
         allow_replacement
             If :obj:`True`, allows the replacement of empty, invalid or low
             altitude targets.
+        time
+            The time at which to check visibility. Defaults to the current time.
 
         """
 
@@ -654,11 +1039,33 @@ class Tile(dict[str, Coordinates | Sequence[Coordinates] | None]):
             sky_coords = {}
 
         valid_sky_coords: dict[str, SkyCoordinates] = {}
-        assigned_coordinates: Sequence[CoordTuple] = []
+        assigned_coordinates = ExcludedCoordinates()
+
+        # Telescopes for which we need to select new coordinates. All of them
+        # are selected at once after verifying the coordinates we were given.
+        replace_telescopes: list[str] = []
 
         for telescope in ["skye", "skyw"]:
             tel_coords = sky_coords.get(telescope, None)
 
+            # If both coordinates are assigned, check that they are not identical.
+            # Use the input values so that we don't create a SkyCoordinates object
+            # only to discard it.
+            if (
+                allow_replacement
+                and tel_coords is not None
+                and telescope == "skyw"
+                and "skye" in valid_sky_coords
+            ):
+                if isinstance(tel_coords, SkyCoordinates):
+                    tel_radec = (tel_coords.ra, tel_coords.dec)
+                else:
+                    tel_radec = (tel_coords[0], tel_coords[1])
+
+                skye_coords = valid_sky_coords["skye"]
+                if tel_radec == (skye_coords.ra, skye_coords.dec):
+                    tel_coords = None
+
             replace: bool = False
             if tel_coords is None:
                 replace = True
@@ -672,36 +1079,15 @@ class Tile(dict[str, Coordinates | Sequence[Coordinates] | None]):
                     valid_sky_coords[telescope] = tel_coords
                 continue
 
-            # If both coordinates are assigned, check that they are not identical.
-            if (
-                tel_coords is not None
-                and telescope == "skyw"
-                and "skye" in valid_sky_coords
-            ):
-                if (
-                    tel_coords.ra == valid_sky_coords["skye"].ra
-                    and tel_coords.dec == valid_sky_coords["skye"].dec
-                ):
-                    tel_coords = None
-                    replace = True
-
             if replace:
-                try:
-                    tel_coords = SkyCoordinates.from_science_coordinates(
-                        self.sci_coords,
-                        exclude_coordinates=assigned_coordinates,
-                    )
-                except Exception as err:
-                    warnings.warn(
-                        f"Failed getting sky coordinates for {telescope}: {err}",
-                        GortWarning,
-                    )
-                    continue
+                replace_telescopes.append(telescope)
+                continue
 
             try:
                 assert tel_coords is not None
                 tel_coords.verify_and_replace(
                     exclude_coordinates=assigned_coordinates,
+                    time=time,
                 )
             except Exception as err:
                 warnings.warn(
@@ -710,9 +1096,31 @@ class Tile(dict[str, Coordinates | Sequence[Coordinates] | None]):
                 )
                 continue
 
-            assigned_coordinates.append((tel_coords.ra, tel_coords.dec))
+            assigned_coordinates.append(tel_coords.ra, tel_coords.dec)
             valid_sky_coords[telescope] = tel_coords
 
+        if len(replace_telescopes) > 0:
+            new_sky_coords: list[SkyCoordinates] = []
+
+            try:
+                new_sky_coords = SkyCoordinates.get_n_nearest(
+                    self.sci_coords,
+                    len(replace_telescopes),
+                    exclude_coordinates=assigned_coordinates,
+                    time=time,
+                )
+            except Exception as err:
+                warnings.warn(f"Failed getting sky coordinates: {err}", GortWarning)
+
+            for telescope, tel_coords in zip(replace_telescopes, new_sky_coords):
+                valid_sky_coords[telescope] = tel_coords
+
+            for telescope in replace_telescopes[len(new_sky_coords) :]:
+                warnings.warn(
+                    f"Failed getting sky coordinates for {telescope}.",
+                    GortWarning,
+                )
+
         self.sky_coords = valid_sky_coords
 
         return self.sky_coords
@@ -721,6 +1129,7 @@ class Tile(dict[str, Coordinates | Sequence[Coordinates] | None]):
         self,
         spec_coords: SpecCoordsType = None,
         reject_invisible: bool = True,
+        time: Time | None = None,
     ) -> Sequence[StandardCoordinates]:
         """Sets the spec telescope coordinates.
 
@@ -729,7 +1138,9 @@ class Tile(dict[str, Coordinates | Sequence[Coordinates] | None]):
         spec_coords
             A list of coordinates to observe with the spectrophotometric telescope.
         reject_invisible
-            Skip targets that are not visible now.
+            Skip targets that are not visible at ``time``.
+        time
+            The time at which to check visibility. Defaults to the current time.
 
         """
 
@@ -750,11 +1161,19 @@ class Tile(dict[str, Coordinates | Sequence[Coordinates] | None]):
                 else:
                     raise TypeError(f"Invalid spec coordinate {coords!r}.")
 
-                if reject_invisible and not coords.is_observable():
-                    continue
-
                 valid_spec_coords.append(coords)
 
+        if reject_invisible and len(valid_spec_coords) > 0:
+            # Check the visibility of all the standards at once.
+            visible = _get_visible_mask(
+                numpy.array([coords.ra for coords in valid_spec_coords]),
+                numpy.array([coords.dec for coords in valid_spec_coords]),
+                time=time,
+            )
+            valid_spec_coords = [
+                coords for coords, vis in zip(valid_spec_coords, visible) if vis
+            ]
+
         self.spec_coords = valid_spec_coords
 
         return self.spec_coords
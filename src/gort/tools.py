@@ -9,13 +9,16 @@
 from __future__ import annotations
 
 import asyncio
+import atexit
 import concurrent.futures
 import datetime
 import functools
 import hashlib
 import logging
+import math
 import os
 import pathlib
+import random
 import re
 import tempfile
 import warnings
@@ -38,8 +41,7 @@ import numpy
 import peewee
 import polars
 import redis
-from astropy import units as uu
-from astropy.coordinates import angular_separation as astropy_angular_separation
+from playhouse.pool import PooledPostgresqlDatabase
 from redis import asyncio as aioredis
 
 from clu import AMQPClient
@@ -62,6 +64,7 @@ __all__ = [
     "get_calibrators",
     "get_next_tile_id_sync",
     "get_calibrators_sync",
+    "get_next_tile_and_calibrators",
     "register_observation",
     "get_ccd_frame_path",
     "move_mask_interval",
@@ -110,42 +113,164 @@ CAMERAS = [
 ]
 
 
+# Matches characters that are not valid in a variable name.
+_VARNAME_RE = re.compile(r"\W|^(?=\d)")
+
+
 def get_valid_variable_name(var_name: str):
     """Converts a string to a valid variable name."""
 
-    return re.sub(r"\W|^(?=\d)", "_", var_name)
+    return _VARNAME_RE.sub("_", var_name)
+
+
+# Long-lived clients for the scheduler API. Reusing the same client keeps the
+# connections alive between requests. The async client is bound to the event loop
+# in which it was created so we keep track of the loop as well.
+SCHEDULER_HTTP_LIMITS = httpx.Limits(max_keepalive_connections=10, max_connections=20)
+SCHEDULER_HTTP_TIMEOUT = httpx.Timeout(5.0, connect=3.0)
+
+_scheduler_client_sync: httpx.Client | None = None
+_scheduler_client_async: httpx.AsyncClient | None = None
+_scheduler_client_async_loop: asyncio.AbstractEventLoop | None = None
+
+# Keeps references to the tasks closing replaced async clients.
+_scheduler_client_close_tasks: set[asyncio.Task] = set()
+
+
+def _get_scheduler_base_url() -> str:
+    """Returns the base URL of the scheduler API from the configuration."""
+
+    sch_config = config["services"]["scheduler"]
+
+    return f"http://{sch_config['host']}:{sch_config['port']}/"
+
+
+def _get_scheduler_client_sync() -> httpx.Client:
+    """Returns the shared synchronous client for the scheduler API."""
+
+    global _scheduler_client_sync
+
+    base_url = _get_scheduler_base_url()
+    client = _scheduler_client_sync
+
+    if client is not None and str(client.base_url) != base_url:
+        # The configuration has been reloaded with a different host or port.
+        client.close()
+        client = None
+
+    if client is None or client.is_closed:
+        client = httpx.Client(
+            base_url=base_url,
+            limits=SCHEDULER_HTTP_LIMITS,
+            timeout=SCHEDULER_HTTP_TIMEOUT,
+        )
+        _scheduler_client_sync = client
+
+    return client
+
+
+def _get_scheduler_client_async() -> httpx.AsyncClient:
+    """Returns the shared asynchronous client for the scheduler API.
+
+    A new client is created if the current one was created in a different
+    event loop or if the scheduler host or port have changed. The replaced
+    client is closed in the loop in which it was created.
+
+    """
+
+    global _scheduler_client_async, _scheduler_client_async_loop
+
+    base_url = _get_scheduler_base_url()
+    loop = asyncio.get_running_loop()
+    client = _scheduler_client_async
+
+    if (
+        client is None
+        or client.is_closed
+        or _scheduler_client_async_loop is not loop
+        or str(client.base_url) != base_url
+    ):
+        if client is not None:
+            _close_scheduler_client_async(client, _scheduler_client_async_loop)
+
+        client = httpx.AsyncClient(
+            base_url=base_url,
+            limits=SCHEDULER_HTTP_LIMITS,
+            timeout=SCHEDULER_HTTP_TIMEOUT,
+        )
+        _scheduler_client_async = client
+        _scheduler_client_async_loop = loop
+
+    return client
+
+
+def _close_scheduler_client_async(
+    client: httpx.AsyncClient,
+    loop: asyncio.AbstractEventLoop | None,
+):
+    """Closes an async scheduler client in the loop in which it was created.
+
+    If that loop is already closed its connections cannot be closed gracefully
+    anymore and the client is simply discarded.
+
+    """
+
+    if client.is_closed or loop is None or loop.is_closed():
+        return
+
+    try:
+        running_loop = asyncio.get_running_loop()
+    except RuntimeError:
+        running_loop = None
+
+    if loop is running_loop:
+        task = loop.create_task(client.aclose())
+        _scheduler_client_close_tasks.add(task)
+        task.add_done_callback(_scheduler_client_close_tasks.discard)
+    elif loop.is_running():
+        asyncio.run_coroutine_threadsafe(client.aclose(), loop)
+    elif running_loop is None:
+        loop.run_until_complete(client.aclose())
+
+
+def _close_scheduler_clients():
+    """Closes the shared scheduler clients on exit."""
+
+    if _scheduler_client_sync is not None:
+        _scheduler_client_sync.close()
+
+    if _scheduler_client_async is not None:
+        _close_scheduler_client_async(
+            _scheduler_client_async,
+            _scheduler_client_async_loop,
+        )
+
+
+atexit.register(_close_scheduler_clients)
 
 
 def get_next_tile_id_sync() -> dict:
     """Retrieves the next ``tile_id`` from the scheduler API. Synchronous version."""
 
-    sch_config = config["services"]["scheduler"]
-    host = sch_config["host"]
-    port = sch_config["port"]
+    client = _get_scheduler_client_sync()
 
-    with httpx.Client(base_url=f"http://{host}:{port}/") as client:
-        resp = client.get("next_tile")
-        if resp.status_code != 200:
-            raise httpx.RequestError("Failed request to /next_tile")
-        tile_id_data = resp.json()
+    resp = client.get("next_tile")
+    if resp.status_code != 200:
+        raise httpx.RequestError("Failed request to /next_tile")
 
-    return tile_id_data
+    return resp.json()
 
 
 async def get_next_tile_id() -> dict:
     """Retrieves the next ``tile_id`` from the scheduler API."""
 
-    sch_config = config["services"]["scheduler"]
-    host = sch_config["host"]
-    port = sch_config["port"]
+    client = _get_scheduler_client_async()
 
-    async with httpx.AsyncClient(base_url=f"http://{host}:{port}/") as client:
-        resp = await client.get("next_tile")
-        if resp.status_code != 200:
-            raise httpx.RequestError("Failed request to /next_tile")
-        tile_id_data = resp.json()
+    resp = await client.get("next_tile")
+    if resp.status_code != 200:
+        raise httpx.RequestError("Failed request to /next_tile")
 
-    return tile_id_data
+    return resp.json()
 
 
 def get_calibrators_sync(
@@ -155,19 +280,16 @@ def get_calibrators_sync(
 ) -> dict:
     """Get calibrators for a ``tile_id`` or science pointing. Synchronous version."""
 
-    sch_config = config["services"]["scheduler"]
-    host = sch_config["host"]
-    port = sch_config["port"]
-
-    with httpx.Client(base_url=f"http://{host}:{port}/") as client:
-        if tile_id:
-            resp = client.get("cals", params={"tile_id": tile_id})
-        elif ra is not None and dec is not None:
-            resp = client.get("cals", params={"ra": ra, "dec": dec})
-        else:
-            raise ValueError("ra and dec are required.")
-        if resp.status_code != 200:
-            raise httpx.RequestError("Failed request to /cals")
+    client = _get_scheduler_client_sync()
+
+    if tile_id:
+        resp = client.get("cals", params={"tile_id": tile_id})
+    elif ra is not None and dec is not None:
+        resp = client.get("cals", params={"ra": ra, "dec": dec})
+    else:
+        raise ValueError("ra and dec are required.")
+    if resp.status_code != 200:
+        raise httpx.RequestError("Failed request to /cals")
 
     return resp.json()
 
@@ -179,39 +301,89 @@ async def get_calibrators(
 ):
     """Get calibrators for a ``tile_id`` or science pointing."""
 
-    sch_config = config["services"]["scheduler"]
-    host = sch_config["host"]
-    port = sch_config["port"]
-
-    async with httpx.AsyncClient(base_url=f"http://{host}:{port}/") as client:
-        if tile_id:
-            resp = await client.get("cals", params={"tile_id": tile_id})
-        elif ra is not None and dec is not None:
-            resp = await client.get("cals", params={"ra": ra, "dec": dec})
-        else:
-            raise ValueError("ra and dec are required.")
-        if resp.status_code != 200:
-            raise httpx.RequestError("Failed request to /cals")
+    client = _get_scheduler_client_async()
+
+    if tile_id:
+        resp = await client.get("cals", params={"tile_id": tile_id})
+    elif ra is not None and dec is not None:
+        resp = await client.get("cals", params={"ra": ra, "dec": dec})
+    else:
+        raise ValueError("ra and dec are required.")
+    if resp.status_code != 200:
+        raise httpx.RequestError("Failed request to /cals")
 
     return resp.json()
 
 
-async def register_observation(payload: dict):
-    """Registers an observation with the scheduler."""
+async def get_next_tile_and_calibrators() -> tuple[dict, dict | None]:
+    """Retrieves the next ``tile_id`` and its calibrators from the scheduler.
 
-    sch_config = config["services"]["scheduler"]
-    host = sch_config["host"]
-    port = sch_config["port"]
+    Both requests are issued on the same pooled connection. The calibrators
+    depend on the ``tile_id`` returned by the scheduler so the requests cannot
+    be run concurrently.
 
-    async with httpx.AsyncClient() as client:
-        resp = await client.put(
-            f"http://{host}:{port}/register_observation",
-            json=payload,
-            follow_redirects=True,
-        )
+    Returns
+    -------
+    data
+        A tuple with the next tile data, as returned by `.get_next_tile_id`, and
+        the calibrators for that tile. If the scheduler could not find a valid
+        tile, the calibrators are :obj:`None`.
+
+    """
+
+    tile_id_data = await get_next_tile_id()
+
+    tile_id = tile_id_data.get("tile_id", None)
+    if tile_id is None or tile_id < 0:
+        return tile_id_data, None
+
+    calibrator_data = await get_calibrators(tile_id=tile_id)
+
+    return tile_id_data, calibrator_data
+
+
+async def register_observation(payload: dict, n_attempts: int = 3):
+    """Registers an observation with the scheduler.
+
+    Transient failures (the connection to the scheduler cannot be established
+    or the scheduler is temporarily unavailable) are retried with exponential
+    backoff. Only failures for which the observation cannot have been recorded
+    are retried, to avoid registering it twice.
+
+    Parameters
+    ----------
+    payload
+        The observation data to register.
+    n_attempts
+        The maximum number of attempts.
 
-        if resp.status_code != 200 or not resp.json()["success"]:
-            raise RuntimeError(f"Failed registering observation: {resp.text}.")
+    """
+
+    client = _get_scheduler_client_async()
+    n_attempts = max(n_attempts, 1)
+
+    for attempt in range(1, n_attempts + 1):
+        last_attempt = attempt == n_attempts
+
+        try:
+            resp = await client.put(
+                "register_observation",
+                json=payload,
+                follow_redirects=True,
+            )
+        except (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout):
+            if last_attempt:
+                raise
+        else:
+            if resp.status_code not in (502, 503) or last_attempt:
+                break
+
+        # Exponential backoff with jitter: 0.5, 1, 2, ... seconds up to 5 seconds.
+        delay = min(0.5 * 2 ** (attempt - 1), 5)
+        await asyncio.sleep(delay * random.uniform(0.5, 1))
+
+    if resp.status_code != 200 or not resp.json()["success"]:
+        raise RuntimeError(f"Failed registering observation: {resp.text}.")
 
 
 def mark_exposure_bad(tile_id: int, dither_position: int = 0):
@@ -222,48 +394,52 @@ def mark_exposure_bad(tile_id: int, dither_position: int = 0):
     completion_status = peewee.Table("completion_status", schema="lvmopsdb").bind(db)
     dither = peewee.Table("dither", schema="lvmopsdb").bind(db)
 
-    dither_pk = (
-        dither.select(dither.c.pk)
-        .where(
-            dither.c.tile_id == tile_id,
-            dither.c.position == dither_position,
+    try:
+        dither_pk = (
+            dither.select(dither.c.pk)
+            .where(
+                dither.c.tile_id == tile_id,
+                dither.c.position == dither_position,
+            )
+            .namedtuples()
         )
-        .namedtuples()
-    )
 
-    if len(dither_pk) == 0:
-        raise ValueError("No matching tile-position.")
+        if len(dither_pk) == 0:
+            raise ValueError("No matching tile-position.")
 
-    completion_status.update(done=False).where(
-        completion_status.c.pk == dither_pk[0].pk
-    ).execute()
+        completion_status.update(done=False).where(
+            completion_status.c.pk == dither_pk[0].pk
+        ).execute()
+    finally:
+        db.close()
 
 
 async def set_tile_status(tile_id: int, enabled: bool = True):
     """Enables/disables a tile in the database."""
 
-    sch_config = config["services"]["scheduler"]
-    host = sch_config["host"]
-    port = sch_config["port"]
+    client = _get_scheduler_client_async()
 
     disable = "false" if enabled else "true"
 
-    async with httpx.AsyncClient() as client:
-        resp = await client.put(
-            f"http://{host}:{port}/tile_status/?tile_id={tile_id}&disable={disable}",
-            json={},
-            follow_redirects=True,
-        )
+    resp = await client.put(
+        f"tile_status/?tile_id={tile_id}&disable={disable}",
+        json={},
+        follow_redirects=True,
+    )
 
-        if resp.status_code != 200 or not resp.json()["success"]:
-            raise RuntimeError(f"Failed setting tile status: {resp.text}.")
+    if resp.status_code != 200 or not resp.json()["success"]:
+        raise RuntimeError(f"Failed setting tile status: {resp.text}.")
 
 
+@functools.lru_cache(maxsize=None)
 def is_notebook() -> bool:
     """Returns :obj:`True` if the code is run inside a Jupyter Notebook.
 
     https://stackoverflow.com/questions/15411967/how-can-i-check-if-code-is-executed-in-the-ipython-notebook
 
+    The result is cached since the environment does not change during the
+    lifetime of the process.
+
     """
 
     try:
@@ -278,6 +454,7 @@ def is_notebook() -> bool:
         return False  # Probably standard Python interpreter
 
 
+@functools.lru_cache(maxsize=None)
 def is_interactive():
     """Returns :obj:`True` is we are in an interactive session."""
 
@@ -298,9 +475,10 @@ def get_ccd_frame_path(
     ----------
     frame_id
         The spectrograph frame for which the paths are searched.
-    mjd
-        The SJD in which the frames where taken. If not provided, all the
-        directories under ``spectro_path`` are searched.
+    sjd
+        The SJD in which the frames where taken. If not provided, the SJD
+        directories under ``spectro_path`` are searched from the most recent
+        one and the files in the first directory with matches are returned.
     cameras
         The cameras to be returned. If :obj:`None`, all cameras found are returned.
     spectro_path
@@ -318,28 +496,36 @@ def get_ccd_frame_path(
         cameras = [cameras]
 
     base_path = pathlib.Path(spectro_path)
-    recursive = True
-    if sjd:
-        base_path /= str(sjd)
-        recursive = False
-
-    # Glob all files that match the frame_id.
     globp = f"*{frame_id}.fits.*"
-    if recursive:
-        globp = f"**/{globp}"
 
-    files = [str(path) for path in base_path.glob(globp)]
+    paths: list[pathlib.Path] = []
+    if sjd:
+        paths = list((base_path / str(sjd)).glob(globp))
+    elif base_path.exists():
+        # Instead of a recursive glob over the whole archive, search the SJD
+        # directories from the most recent one and stop at the first match.
+        sjd_dirs = [
+            path
+            for path in base_path.iterdir()
+            if path.name.isdigit() and path.is_dir()
+        ]
+        for sjd_dir in sorted(sjd_dirs, key=lambda path: int(path.name), reverse=True):
+            paths = list(sjd_dir.glob(globp))
+            if len(paths) > 0:
+                break
 
     if cameras is None:
-        return files
+        return [str(path) for path in paths]
 
-    files_camera = []
-    for camera in cameras:
-        for file in files:
-            if f"-{camera}-" in file:
-                files_camera.append(file)
+    # Bucket the files by the hyphen-separated fields in their names, which
+    # include the camera (e.g., sdR-s-b1-00001234.fits.gz), so that each
+    # file name is only parsed once.
+    files_by_camera: dict[str, list[str]] = {}
+    for path in paths:
+        for field in path.name.split("-")[1:-1]:
+            files_by_camera.setdefault(field, []).append(str(path))
 
-    return files_camera
+    return [file for camera in cameras for file in files_by_camera.get(camera, [])]
 
 
 async def move_mask_interval(
@@ -410,42 +596,107 @@ async def move_mask_interval(
 
     assert time_per_position is not None
 
+    loop = asyncio.get_running_loop()
+    notifier_is_coro = asyncio.iscoroutinefunction(notifier)
+
     for position in positions:
         await fibsel.move_to_position(position)
 
+        # Time at which we must leave this position. Measured from the moment the
+        # mask arrived so that the time spent in the notifier is not added.
+        deadline = loop.time() + time_per_position
+
         # Notify.
         if notifier is not None:
-            if asyncio.iscoroutinefunction(notifier):
+            if notifier_is_coro:
                 asyncio.create_task(notifier(position))
             else:
                 notifier(position)
 
-        await asyncio.sleep(time_per_position)
+        await asyncio.sleep(max(0.0, deadline - loop.time()))
 
 
-def angular_separation(lon1: float, lat1: float, lon2: float, lat2: float):
-    """A wrapper around astropy's ``angular_separation``.
+def angular_separation(lon1, lat1, lon2, lat2):
+    """Returns the separation between two sets of coordinates.
 
-    Returns the separation between two sets of coordinates. All units must
-    be degrees and the returned values is also the separation in degrees.
+    Uses the Vincenty formula, as astropy's ``angular_separation``, but without
+    creating quantities. All units must be degrees and the returned value is
+    also the separation in degrees. Inputs can be scalars or arrays.
 
     """
 
-    separation = astropy_angular_separation(
-        lon1 * uu.degree,  # type: ignore
-        lat1 * uu.degree,  # type: ignore
-        lon2 * uu.degree,  # type: ignore
-        lat2 * uu.degree,  # type: ignore
-    )
+    if all(numpy.isscalar(value) for value in (lon1, lat1, lon2, lat2)):
+        lon1, lat1, lon2, lat2 = map(math.radians, (lon1, lat1, lon2, lat2))
+        sin, cos, atan2, hypot = math.sin, math.cos, math.atan2, math.hypot
+        degrees = math.degrees
+    else:
+        lon1, lat1, lon2, lat2 = map(numpy.radians, (lon1, lat1, lon2, lat2))
+        sin, cos, atan2, hypot = numpy.sin, numpy.cos, numpy.arctan2, numpy.hypot
+        degrees = numpy.degrees
+
+    sdlon = sin(lon2 - lon1)
+    cdlon = cos(lon2 - lon1)
+    slat1 = sin(lat1)
+    slat2 = sin(lat2)
+    clat1 = cos(lat1)
+    clat2 = cos(lat2)
+
+    num1 = clat2 * sdlon
+    num2 = clat1 * slat2 - slat1 * clat2 * cdlon
+    denominator = slat1 * slat2 + clat1 * clat2 * cdlon
+
+    return degrees(atan2(hypot(num1, num2), denominator))
+
+
+_db_pool: PooledPostgresqlDatabase | None = None
+_db_pool_params: dict[str, Any] | None = None
+
+
+def _get_db_connection_params() -> dict[str, Any]:
+    """Returns the database connection parameters from the configuration."""
+
+    return dict(config["services"]["database"]["connection"])
+
+
+def _get_db_pool() -> PooledPostgresqlDatabase:
+    """Returns the shared database connection pool.
+
+    The pool is recreated if the connection parameters in the configuration
+    have changed since it was created.
+
+    """
+
+    global _db_pool, _db_pool_params
+
+    params = _get_db_connection_params()
+
+    if _db_pool is not None and params != _db_pool_params:
+        _db_pool.close_all()
+        _db_pool = None
+
+    if _db_pool is None:
+        _db_pool = PooledPostgresqlDatabase(
+            **params,
+            max_connections=8,
+            stale_timeout=300,
+        )
+        _db_pool_params = params
 
-    return separation.to("deg").value
+    return _db_pool
 
 
 def get_db_connection():
-    """Returns a DB connection from the configuration file parameters."""
+    """Returns a DB connection from the configuration file parameters.
+
+    The database object is shared and connections are taken from a pool.
+    Calling ``close()`` on the returned object returns the connection of the
+    current thread to the pool.
 
-    conn = peewee.PostgresqlDatabase(**config["services"]["database"]["connection"])
-    assert conn.connect(), "Database connection failed."
+    """
+
+    conn = _get_db_pool()
+    conn.connect(reuse_if_open=True)
+    assert not conn.is_closed(), "Database connection failed."
 
     return conn
 
@@ -474,6 +725,28 @@ def redis_client_sync() -> Generator[redis.Redis, None]:
     client.close()
 
 
+# Shared executor pools for run_in_executor. Created on first use.
+_executor_pools: dict[str, concurrent.futures.Executor] = {}
+
+
+def _get_executor_pool(executor: str) -> concurrent.futures.Executor:
+    """Returns the shared thread or process pool."""
+
+    if executor not in ("thread", "process"):
+        raise ValueError("Invalid executor name.")
+
+    if executor not in _executor_pools:
+        if executor == "thread":
+            pool = concurrent.futures.ThreadPoolExecutor()
+        else:
+            pool = concurrent.futures.ProcessPoolExecutor()
+
+        _executor_pools[executor] = pool
+        atexit.register(pool.shutdown, wait=False)
+
+    return _executor_pools[executor]
+
+
 async def run_in_executor(fn, *args, catch_warnings=False, executor="thread", **kwargs):
     """Runs a function in an executor.
 
@@ -486,28 +759,33 @@ async def run_in_executor(fn, *args, catch_warnings=False, executor="thread", **
     In general, note that the function must not try to do anything with
     the actor since they run on different loops.
 
+    The executors are shared between calls so that the threads or processes
+    are not created every time.
+
     """
 
     fn = partial(fn, *args, **kwargs)
 
-    if executor == "thread":
-        executor = concurrent.futures.ThreadPoolExecutor
-    elif executor == "process":
-        executor = concurrent.futures.ProcessPoolExecutor
-    else:
-        raise ValueError("Invalid executor name.")
+    pool = _get_executor_pool(executor)
+    loop = asyncio.get_running_loop()
 
-    if catch_warnings:
-        with warnings.catch_warnings(record=True) as records:
-            with executor() as pool:
-                result = await asyncio.get_event_loop().run_in_executor(pool, fn)
+    try:
+        if catch_warnings:
+            with warnings.catch_warnings(record=True) as records:
+                result = await loop.run_in_executor(pool, fn)
 
-        for ww in records:
-            warnings.warn(ww.message, ww.category)
+            for ww in records:
+                warnings.warn(ww.message, ww.category)
 
-    else:
-        with executor() as pool:
-            result = await asyncio.get_running_loop().run_in_executor(pool, fn)
+        else:
+            result = await loop.run_in_executor(pool, fn)
+
+    except concurrent.futures.BrokenExecutor:
+        # If a worker died the pool cannot be used anymore. Discard it so that
+        # the next call creates a new one.
+        if _executor_pools.get(executor, None) is pool:
+            _executor_pools.pop(executor)
+        raise
 
     return result
 
@@ -584,7 +862,10 @@ def insert_to_database(
     table = peewee.Table(table_name, schema=schema, columns=columns)
     table.bind(conn)
 
-    table.insert(payload).execute()
+    try:
+        table.insert(payload).execute()
+    finally:
+        conn.close()
 
 
 def get_md5sum_file(file: AnyPath):
@@ -676,7 +957,11 @@ def get_by_source_id(source_id: int) -> dict | None:
     gaia_dr3 = peewee.Table("gaia_dr3_source", schema="catalogdb").bind(db)
 
     query = gaia_dr3.select(gaia_dr3.star).where(gaia_dr3.c.source_id == source_id)
-    data = query.dicts()
+
+    try:
+        data = list(query.dicts())
+    finally:
+        db.close()
 
     if len(data) == 0:
         return None
@@ -814,22 +1099,23 @@ class GuiderMonitor:
     async def _handle_guider_reply(self, reply: AMQPReply):
         """Processes an actor reply and stores the collected data."""
 
-        if self.actor is not None:
-            if self.actor not in str(reply.sender):
-                return
-        else:
-            if ".guider" not in str(reply.sender):
-                return
+        sender = str(reply.sender)
+
+        # Most replies on the exchange are not from a guider. Reject them first.
+        if not sender.endswith(".guider"):
+            return
+
+        if self.actor is not None and self.actor not in sender:
+            return
 
         body = reply.body
 
-        telescope = str(reply.sender).split(".")[1]
+        telescope = sender.split(".")[1]
         frameno: int | None = None
         new_data: dict[str, Any] = {}
 
         try:
-            if "frame" in body:
-                frame = body["frame"]
+            if (frame := body.get("frame", None)) is not None:
                 frameno = frame["seqno"]
                 new_data = {
                     "frameno": frameno,
@@ -840,8 +1126,7 @@ class GuiderMonitor:
                     "fwhm": frame["fwhm"],
                 }
 
-            elif "measured_pointing" in body:
-                measured_pointing = body["measured_pointing"]
+            elif (measured_pointing := body.get("measured_pointing", None)) is not None:
                 frameno = measured_pointing["frameno"]
                 new_data = {
                     "frameno": frameno,
@@ -857,8 +1142,9 @@ class GuiderMonitor:
                     "mode": measured_pointing["mode"],
                 }
 
-            elif "correction_applied" in body:
-                correction_applied = body["correction_applied"]
+            elif (
+                correction_applied := body.get("correction_applied", None)
+            ) is not None:
                 frameno = correction_applied["frameno"]
                 new_data = {
                     "frameno": frameno,
@@ -11,6 +11,7 @@ from __future__ import annotations
 import math
 import pathlib
 import re
+from functools import lru_cache
 
 import astropy.coordinates
 import astropy.time
@@ -101,6 +102,9 @@ def read_fibermap(
 
     _FIBERMAP_CACHE = fibers
 
+    # The fibre positions may have changed.
+    fibre_to_master_frame.cache_clear()
+
     return _FIBERMAP_CACHE
 
 
@@ -297,9 +301,13 @@ def radec_sexagesimal_to_decimal(ra: str, dec: str, ra_is_hours: bool = True):
     return ra_deg, dec_deg
 
 
+@lru_cache(maxsize=None)
 def fibre_to_master_frame(fibre_name: str):
     """Returns the xz coordinates in the master frame of a named fibres.
 
+    Results are cached since the mapping only changes if the fibermap is
+    re-read with `.read_fibermap`, which clears the cache.
+
     Parameters
     ----------
     fibre_name
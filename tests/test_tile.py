@@ -0,0 +1,313 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# @Author: José Sánchez-Gallego (gallegoj@uw.edu)
+# @Date: 2026-10-15
+# @Filename: test_tile.py
+# @License: BSD 3-clause (http://www.opensource.org/licenses/BSD-3-Clause)
+
+from __future__ import annotations
+
+import numpy
+import pytest
+from astropy.coordinates import SkyCoord
+from pytest_mock import MockerFixture
+
+from gort.tile import (
+    Coordinates,
+    ExcludedCoordinates,
+    ScienceCoordinates,
+    SkyCoordinates,
+    Tile,
+    _bounding_box_mask,
+)
+
+
+def _separation(ra1, dec1, ra2, dec2):
+    """Returns the separation between coordinates using astropy."""
+
+    c1 = SkyCoord(ra=ra1, dec=dec1, unit="deg")
+    c2 = SkyCoord(ra=ra2, dec=dec2, unit="deg")
+
+    return c1.separation(c2).deg
+
+
+def _set_targets(monkeypatch: pytest.MonkeyPatch, ra, dec):
+    """Replaces the sky catalogue with a list of coordinates."""
+
+    monkeypatch.setattr(SkyCoordinates, "targets_ra", numpy.asarray(ra, float))
+    monkeypatch.setattr(SkyCoordinates, "targets_dec", numpy.asarray(dec, float))
+    monkeypatch.setattr(SkyCoordinates, "targets_xyz", None)
+
+
+@pytest.fixture()
+def sky_targets(monkeypatch: pytest.MonkeyPatch):
+    """Sets a random sky catalogue uniformly distributed on the sphere."""
+
+    rng = numpy.random.default_rng(42)
+
+    ra = rng.uniform(0, 360, 20000)
+    dec = numpy.degrees(numpy.arcsin(rng.uniform(-1, 1, 20000)))
+
+    _set_targets(monkeypatch, ra, dec)
+
+    yield ra, dec
+
+
+@pytest.fixture()
+def all_visible(mocker: MockerFixture):
+    """Makes all the coordinates observable."""
+
+    mocker.patch(
+        "gort.tile._get_visible_mask",
+        side_effect=lambda ra, dec, **kwargs: numpy.ones(len(ra), dtype=bool),
+    )
+    mocker.patch.object(Coordinates, "is_observable", return_value=True)
+
+    yield
+
+
+@pytest.mark.parametrize(
+    "sci_radec",
+    [(0.0, -30.0), (359.9, 10.0), (120.0, -60.0), (45.0, -89.5), (200.0, 88.0)],
+)
+@pytest.mark.parametrize("n", [1, 2, 4])
+def test_get_n_nearest_sequential(sky_targets, sci_radec: tuple[float, float], n):
+    sci_coords = ScienceCoordinates(*sci_radec)
+
+    nearest = SkyCoordinates.get_n_nearest(sci_coords, n, exclude_invisible=False)
+
+    sequential: list[SkyCoordinates] = []
+    for _ in range(n):
+        coords = SkyCoordinates.from_science_coordinates(
+            sci_coords,
+            exclude_coordinates=[(cc.ra, cc.dec) for cc in sequential],
+            exclude_invisible=False,
+        )
+        sequential.append(coords)
+
+    assert len(nearest) == n
+    assert [(cc.ra, cc.dec) for cc in nearest] == [(cc.ra, cc.dec) for cc in sequential]
+
+
+@pytest.mark.parametrize(
+    "sci_radec",
+    [(0.0, -30.0), (359.9, 10.0), (180.0, 0.0), (45.0, -89.5), (200.0, 88.0)],
+)
+def test_get_n_nearest_closest(sky_targets, sci_radec: tuple[float, float]):
+    ra, dec = sky_targets
+
+    nearest = SkyCoordinates.from_science_coordinates(
+        ScienceCoordinates(*sci_radec),
+        exclude_invisible=False,
+    )
+
+    idx = numpy.argmin(_separation(ra, dec, *sci_radec))
+    assert (nearest.ra, nearest.dec) == (ra[idx], dec[idx])
+
+
+@pytest.mark.parametrize(
+    "centre",
+    [(0.5, -30.0), (359.5, 10.0), (0.0, 0.0), (10.0, -87.0), (200.0, 86.5)],
+)
+def test_bounding_box_mask(sky_targets, centre: tuple[float, float]):
+    ra, dec = sky_targets
+
+    mask = _bounding_box_mask(ra, dec, centre[0], centre[1], 5)
+    within = _separation(ra, dec, *centre) <= 5
+
+    assert within.any()
+    assert mask[within].all()
+
+
+def test_get_n_nearest_wraps_ra(monkeypatch: pytest.MonkeyPatch):
+    _set_targets(monkeypatch, [0.2, 356.0, 3.0], [0.0, 0.0, 0.0])
+
+    nearest = SkyCoordinates.get_n_nearest(
+        ScienceCoordinates(359.9, 0.0),
+        2,
+        exclude_invisible=False,
+    )
+
+    assert [cc.ra for cc in nearest] == [0.2, 3.0]
+
+
+def test_get_n_nearest_pole(monkeypatch: pytest.MonkeyPatch):
+    _set_targets(monkeypatch, [10.0, 190.0, 100.0], [-88.0, -88.5, -80.0])
+
+    nearest = SkyCoordinates.get_n_nearest(
+        ScienceCoordinates(280.0, -89.0),
+        2,
+        exclude_invisible=False,
+    )
+
+    assert [(cc.ra, cc.dec) for cc in nearest] == [(190.0, -88.5), (10.0, -88.0)]
+
+
+def test_get_n_nearest_outside_search_radius(monkeypatch: pytest.MonkeyPatch):
+    _set_targets(monkeypatch, [100.0, 30.0, 50.0], [0.0, 0.0, 0.0])
+
+    # Only one target is inside the search box so the other one must be
+    # selected from the full catalogue.
+    nearest = SkyCoordinates.get_n_nearest(
+        ScienceCoordinates(27.0, 0.0),
+        2,
+        exclude_invisible=False,
+    )
+
+    assert [cc.ra for cc in nearest] == [30.0, 50.0]
+
+
+def test_get_n_nearest_fewer_than_n(monkeypatch: pytest.MonkeyPatch):
+    _set_targets(monkeypatch, [10.0, 10.5], [0.0, 0.0])
+
+    # The two targets are closer than min_separation so only one is returned.
+    nearest = SkyCoordinates.get_n_nearest(
+        ScienceCoordinates(10.0, 0.0),
+        2,
+        exclude_invisible=False,
+    )
+
+    assert [cc.ra for cc in nearest] == [10.0]
+
+
+@pytest.mark.parametrize("n", [0, -1])
+def test_get_n_nearest_invalid_n(sky_targets, n: int):
+    with pytest.raises(ValueError):
+        SkyCoordinates.get_n_nearest(
+            ScienceCoordinates(10.0, 0.0),
+            n,
+            exclude_invisible=False,
+        )
+
+
+def test_excluded_coordinates():
+    excluded = ExcludedCoordinates([(10.0, -20.0)])
+    excluded.append(30.0, 40.0)
+    excluded.extend([50.0, 60.0], [-70.0, 80.0])
+
+    assert len(excluded) == 4
+    numpy.testing.assert_array_equal(excluded.ra, [10.0, 30.0, 50.0, 60.0])
+    numpy.testing.assert_array_equal(excluded.dec, [-20.0, 40.0, -70.0, 80.0])
+
+    sc = SkyCoord(ra=excluded.ra, dec=excluded.dec, unit="deg")
+    numpy.testing.assert_allclose(excluded.xyz, sc.cartesian.xyz.value.T, atol=1e-12)
+
+
+def test_excluded_coordinates_empty():
+    excluded = ExcludedCoordinates()
+
+    assert len(excluded) == 0
+    assert excluded.xyz.shape == (0, 3)
+
+
+@pytest.mark.parametrize("as_object", [False, True])
+def test_get_n_nearest_excluded(sky_targets, as_object: bool):
+    ra, dec = sky_targets
+
+    sci_coords = ScienceCoordinates(150.0, -40.0)
+    first, second = SkyCoordinates.get_n_nearest(
+        sci_coords,
+        2,
+        exclude_invisible=False,
+    )
+
+    exclude = [(first.ra, first.dec)]
+    nearest = SkyCoordinates.get_n_nearest(
+        sci_coords,
+        5,
+        exclude_coordinates=ExcludedCoordinates(exclude) if as_object else exclude,
+        exclude_invisible=False,
+    )
+
+    assert (nearest[0].ra, nearest[0].dec) == (second.ra, second.dec)
+
+    for coords in nearest:
+        assert _separation(coords.ra, coords.dec, first.ra, first.dec) >= 1
+
+
+def test_set_sky_coords_missing(sky_targets, all_visible):
+    sci_coords = ScienceCoordinates(150.0, -40.0)
+
+    tile = Tile(sci_coords)
+    expected = SkyCoordinates.get_n_nearest(sci_coords, 2)
+
+    assert set(tile.sky_coords) == {"skye", "skyw"}
+    assert (tile.sky_coords["skye"].ra, tile.sky_coords["skye"].dec) == (
+        expected[0].ra,
+        expected[0].dec,
+    )
+    assert (tile.sky_coords["skyw"].ra, tile.sky_coords["skyw"].dec) == (
+        expected[1].ra,
+        expected[1].dec,
+    )
+
+
+def test_set_sky_coords_given(sky_targets, all_visible):
+    tile = Tile(
+        ScienceCoordinates(150.0, -40.0),
+        sky_coords={"skye": (151.0, -41.0), "skyw": SkyCoordinates(149.0, -39.0)},
+    )
+
+    assert (tile.sky_coords["skye"].ra, tile.sky_coords["skye"].dec) == (151, -41)
+    assert (tile.sky_coords["skyw"].ra, tile.sky_coords["skyw"].dec) == (149, -39)
+
+
+def test_set_sky_coords_one_missing(sky_targets, all_visible):
+    sci_coords = ScienceCoordinates(150.0, -40.0)
+    skyw = SkyCoordinates.from_science_coordinates(sci_coords)
+
+    tile = Tile(sci_coords, sky_coords={"skyw": (skyw.ra, skyw.dec)})
+
+    skye = tile.sky_coords["skye"]
+    assert (tile.sky_coords["skyw"].ra, tile.sky_coords["skyw"].dec) == (
+        skyw.ra,
+        skyw.dec,
+    )
+    assert _separation(skye.ra, skye.dec, skyw.ra, skyw.dec) >= 1
+
+
+def test_set_sky_coords_identical(sky_targets, all_visible):
+    tile = Tile(
+        ScienceCoordinates(150.0, -40.0),
+        sky_coords={"skye": (151.0, -41.0), "skyw": (151.0, -41.0)},
+    )
+
+    skye = tile.sky_coords["skye"]
+    skyw = tile.sky_coords["skyw"]
+
+    assert (skye.ra, skye.dec) == (151.0, -41.0)
+    assert _separation(skye.ra, skye.dec, skyw.ra, skyw.dec) >= 1
+
+
+def test_set_sky_coords_no_replacement(sky_targets, all_visible):
+    tile = Tile(
+        ScienceCoordinates(150.0, -40.0),
+        sky_coords={"skyw": (151.0, -41.0)},
+        allow_replacement=False,
+    )
+
+    assert tile.sky_coords["skye"] is None
+    assert (tile.sky_coords["skyw"].ra, tile.sky_coords["skyw"].dec) == (151, -41)
+
+
+def test_set_sky_coords_invisible(sky_targets, mocker: MockerFixture):
+    # Only targets close to the celestial south pole are visible.
+    mocker.patch(
+        "gort.tile._get_visible_mask",
+        side_effect=lambda ra, dec, **kwargs: numpy.asarray(dec) < -70,
+    )
+    mocker.patch.object(
+        Coordinates,
+        "is_observable",
+        autospec=True,
+        side_effect=lambda self, **kwargs: self.dec < -70,
+    )
+
+    tile = Tile(
+        ScienceCoordinates(150.0, -40.0),
+        sky_coords={"skye": (151.0, -41.0), "skyw": (10.0, -80.0)},
+    )
+
+    assert tile.sky_coords["skye"].dec < -70
+    assert (tile.sky_coords["skyw"].ra, tile.sky_coords["skyw"].dec) == (10, -80)
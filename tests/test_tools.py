@@ -0,0 +1,161 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# @Author: José Sánchez-Gallego (gallegoj@uw.edu)
+# @Date: 2026-10-15
+# @Filename: test_tools.py
+# @License: BSD 3-clause (http://www.opensource.org/licenses/BSD-3-Clause)
+
+from __future__ import annotations
+
+import pathlib
+
+import numpy
+import pytest
+from astropy import units as uu
+from astropy.coordinates import angular_separation as astropy_angular_separation
+
+from gort.tools import angular_separation, get_ccd_frame_path
+
+
+def _astropy_separation(lon1, lat1, lon2, lat2):
+    """Returns the separation calculated by astropy, in degrees."""
+
+    separation = astropy_angular_separation(
+        lon1 * uu.deg,
+        lat1 * uu.deg,
+        lon2 * uu.deg,
+        lat2 * uu.deg,
+    )
+
+    return separation.to_value(uu.deg)
+
+
+@pytest.mark.parametrize(
+    "coords",
+    [
+        (10.0, 20.0, 10.0, 20.0),
+        (10.0, 20.0, 11.0, 21.0),
+        (359.5, 0.0, 0.5, 0.0),
+        (0.0, -89.9, 180.0, -89.9),
+        (45.0, 30.0, 225.0, -30.0),
+        (100.0, 0.0, 100.0 + 1e-6, 0.0),
+    ],
+)
+def test_angular_separation_scalar(coords: tuple[float, float, float, float]):
+    separation = angular_separation(*coords)
+
+    assert isinstance(separation, float)
+    assert separation == pytest.approx(_astropy_separation(*coords), abs=1e-10)
+
+
+def test_angular_separation_array():
+    rng = numpy.random.default_rng(42)
+
+    lon1, lon2 = rng.uniform(0, 360, (2, 1000))
+    lat1, lat2 = numpy.degrees(numpy.arcsin(rng.uniform(-1, 1, (2, 1000))))
+
+    separation = angular_separation(lon1, lat1, lon2, lat2)
+
+    assert isinstance(separation, numpy.ndarray)
+    assert separation.shape == (1000,)
+    numpy.testing.assert_allclose(
+        separation,
+        _astropy_separation(lon1, lat1, lon2, lat2),
+        rtol=0,
+        atol=1e-10,
+    )
+
+
+def test_angular_separation_broadcast():
+    lon2 = numpy.array([10.0, 190.0, 350.0])
+    lat2 = numpy.array([-30.0, 30.0, 89.0])
+
+    separation = angular_separation(10.0, -30.0, lon2, lat2)
+
+    assert separation.shape == (3,)
+    numpy.testing.assert_allclose(
+        separation,
+        _astropy_separation(10.0, -30.0, lon2, lat2),
+        rtol=0,
+        atol=1e-10,
+    )
+
+
+@pytest.fixture()
+def spectro_path(tmp_path: pathlib.Path):
+    """Creates a mock spectro directory with an SJD structure."""
+
+    files = {
+        "9999": ["sdR-s-b3-00001234.fits.gz"],
+        "60000": [
+            "sdR-s-b1-00001234.fits.gz",
+            "sdR-s-r1-00001234.fits.gz",
+            "sdR-s-b1-00001111.fits.gz",
+        ],
+        "60010": [
+            "sdR-s-b1-00001234.fits.gz",
+            "sdR-s-z2-00001234.fits.gz",
+            "sdR-s-b2-00001234.fits.gz",
+        ],
+        "logs": ["sdR-s-b1-00001234.fits.gz"],
+    }
+
+    for sjd, names in files.items():
+        (tmp_path / sjd).mkdir()
+        for name in names:
+            (tmp_path / sjd / name).touch()
+
+    yield tmp_path
+
+
+def test_get_ccd_frame_path_newest_first(spectro_path: pathlib.Path):
+    paths = get_ccd_frame_path(1234, spectro_path=str(spectro_path))
+
+    assert sorted(paths) == [
+        str(spectro_path / "60010" / "sdR-s-b1-00001234.fits.gz"),
+        str(spectro_path / "60010" / "sdR-s-b2-00001234.fits.gz"),
+        str(spectro_path / "60010" / "sdR-s-z2-00001234.fits.gz"),
+    ]
+
+
+def test_get_ccd_frame_path_older_sjd(spectro_path: pathlib.Path):
+    paths = get_ccd_frame_path(1111, spectro_path=str(spectro_path))
+
+    assert paths == [str(spectro_path / "60000" / "sdR-s-b1-00001111.fits.gz")]
+
+
+def test_get_ccd_frame_path_sjd(spectro_path: pathlib.Path):
+    paths = get_ccd_frame_path(1234, sjd=60000, spectro_path=str(spectro_path))
+
+    assert sorted(paths) == [
+        str(spectro_path / "60000" / "sdR-s-b1-00001234.fits.gz"),
+        str(spectro_path / "60000" / "sdR-s-r1-00001234.fits.gz"),
+    ]
+
+
+def test_get_ccd_frame_path_cameras(spectro_path: pathlib.Path):
+    path_60010 = spectro_path / "60010"
+
+    paths = get_ccd_frame_path(1234, cameras="b1", spectro_path=str(spectro_path))
+    assert paths == [str(path_60010 / "sdR-s-b1-00001234.fits.gz")]
+
+    paths = get_ccd_frame_path(
+        1234,
+        cameras=["z2", "b1", "r1"],
+        spectro_path=str(spectro_path),
+    )
+    assert paths == [
+        str(path_60010 / "sdR-s-z2-00001234.fits.gz"),
+        str(path_60010 / "sdR-s-b1-00001234.fits.gz"),
+    ]
+
+
+@pytest.mark.parametrize("frame_id", [1234, 5678])
+def test_get_ccd_frame_path_empty(tmp_path: pathlib.Path, frame_id: int):
+    assert get_ccd_frame_path(frame_id, spectro_path=str(tmp_path / "missing")) == []
+    assert get_ccd_frame_path(frame_id, spectro_path=str(tmp_path)) == []
+
+
+def test_get_ccd_frame_path_not_found(spectro_path: pathlib.Path):
+    assert get_ccd_frame_path(5678, spectro_path=str(spectro_path)) == []